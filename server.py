@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Any
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
@@ -18,6 +19,11 @@ JIRA_URL = os.getenv("JIRA_URL")
 JIRA_USERNAME = os.getenv("JIRA_USERNAME")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 
+# HTTP connection pool toward Jira; the defaults match requests' own
+JIRA_POOL_CONNECTIONS = int(os.getenv("JIRA_POOL_CONNECTIONS", "10"))
+JIRA_POOL_MAXSIZE = int(os.getenv("JIRA_POOL_MAXSIZE", "10"))
+JIRA_KEEPALIVE = os.getenv("JIRA_KEEPALIVE", "1") != "0"
+
 # Validation
 if not all([JIRA_URL, JIRA_USERNAME, JIRA_API_TOKEN]):
     raise ValueError("Missing JIRA configuration: JIRA_URL, JIRA_USERNAME, JIRA_API_TOKEN")
@@ -26,6 +32,11 @@ if not all([JIRA_URL, JIRA_USERNAME, JIRA_API_TOKEN]):
 session = requests.Session()
 session.auth = (JIRA_USERNAME, JIRA_API_TOKEN)
 session.timeout = 30.0
+_adapter = HTTPAdapter(pool_connections=JIRA_POOL_CONNECTIONS, pool_maxsize=JIRA_POOL_MAXSIZE)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+if not JIRA_KEEPALIVE:
+    session.headers["Connection"] = "close"
 
 # Validation patterns
 PROJECT_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]*$')
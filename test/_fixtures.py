@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Jira test data shared by the test scripts; override with environment variables for another instance."""
+
+import os
+import sys
+from typing import Dict, List, Optional
+
+# Project whose issues the tests read and modify
+PROJECT = os.environ.get("JIRA_TEST_PROJECT", "KW")
+# Existing issue used by the issue, workflow and comment tests
+ISSUE_KEY = os.environ.get("JIRA_TEST_ISSUE", "KW-40")
+# Second existing issue, used as the target of link_issues
+LINKED_ISSUE_KEY = os.environ.get("JIRA_TEST_LINKED_ISSUE", "KW-39")
+# JQL selecting every issue in PROJECT
+PROJECT_JQL = f"project = {PROJECT}"
+
+# Settings server.py refuses to start without
+REQUIRED_JIRA_SETTINGS = ("JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN")
+# Repository root, where server.py and the .env file live
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_PATH = os.path.join(PROJECT_ROOT, ".env")
+
+def _env_file_settings() -> Dict[str, str]:
+    """Read the non-empty settings from the project .env file."""
+    settings = {}
+    if os.path.exists(ENV_PATH):
+        with open(ENV_PATH) as env_file:
+            for line in env_file:
+                name, sep, value = line.strip().partition("=")
+                if sep and value.strip() and not name.startswith("#"):
+                    settings[name.strip()] = value.strip()
+    return settings
+
+def jira_setting(name: str, use_docker: bool = True) -> Optional[str]:
+    """Return a setting as the server will see it.
+
+    Docker runs only get the project .env file; local runs also inherit this
+    process's environment, which takes precedence over .env.
+    """
+    if not use_docker and os.environ.get(name):
+        return os.environ[name]
+    return _env_file_settings().get(name)
+
+def missing_jira_settings(use_docker: bool = True) -> List[str]:
+    """Return the required Jira settings the server would not see.
+
+    Checking up front lets a script stop before it starts a server that
+    would exit on its configuration check.
+    """
+    return [name for name in REQUIRED_JIRA_SETTINGS if not jira_setting(name, use_docker)]
+
+def require_jira_settings(use_docker: bool = True):
+    """Exit with status 1, before any server starts, when a required Jira setting is missing.
+
+    A run that cannot reach Jira is reported as a failure, not a skip, so a
+    misconfigured CI job does not pass silently.
+    """
+    missing = missing_jira_settings(use_docker)
+    if missing:
+        print(f"❌ Missing Jira settings {', '.join(missing)} (set them in .env); no tests were run")
+        sys.exit(1)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""In-process stand-in for McpClient - calls server.py's tool functions directly."""
+
+import asyncio
+import json
+import sys
+import threading
+from typing import Dict, Any, Optional
+
+from _fixtures import PROJECT_ROOT
+
+class InProcessClient:
+    """Answers tools/call requests by importing server.py and calling the tool in this process.
+
+    Skips the subprocess, stdio pipes and JSON-RPC framing, so it exercises
+    tool logic only; keep the stdio McpClient for end-to-end runs. Responses
+    mimic the server's JSON-RPC result shape: a tool that raises is reported
+    the way FastMCP reports it, and tools/list comes from server.mcp.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._lock = threading.Lock()
+        self.server_caps: Dict[str, Any] = {"serverInfo": {"name": "in-process"}, "capabilities": {}}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Import server.py once; it reads the Jira settings from .env on import."""
+        with self._lock:
+            if self._server is None:
+                if PROJECT_ROOT not in sys.path:
+                    sys.path.insert(0, PROJECT_ROOT)
+                import server
+                self._server = server
+
+    def close(self):
+        pass
+
+    def _tool(self, name: str):
+        tool = getattr(self._server, name, None)
+        # Newer FastMCP releases wrap decorated functions in a Tool object
+        return getattr(tool, "fn", tool)
+
+    def request(self, method: str, params: Dict[str, Any] = None, timeout: Optional[float] = None) -> Dict:
+        """Dispatch a tools/call or tools/list request; other methods are not available in-process."""
+        if method == "tools/list":
+            return self.list_tools()
+        if method != "tools/call":
+            return {"error": {"code": -32601, "message": f"{method} is not available in-process"}}
+        params = params or {}
+        return self.call(params.get("name", ""), params.get("arguments", {}))
+
+    def list_tools(self) -> Dict:
+        """Describe the tools registered on server.mcp like a tools/list response."""
+        try:
+            self.start()
+            tools = asyncio.run(self._server.mcp.get_tools())
+            listed = [tool.to_mcp_tool().model_dump(mode="json", by_alias=True, exclude_none=True)
+                      for tool in tools.values()]
+        except Exception as e:
+            return {"error": {"code": -32603, "message": f"Could not list tools: {e}"}}
+        return {"jsonrpc": "2.0", "result": {"tools": listed}}
+
+    def call(self, name: str, args: Dict[str, Any], timeout: Optional[float] = None) -> Dict:
+        """Invoke one tool function and wrap its result like a tools/call response."""
+        try:
+            self.start()
+            fn = self._tool(name)
+            if not callable(fn):
+                return {"error": {"code": -32602, "message": f"Unknown tool: {name}"}}
+            text = json.dumps(fn(**args), indent=2, default=str)
+        except Exception as e:
+            # FastMCP turns a raised exception into an isError result with this text
+            return {"jsonrpc": "2.0", "result": {
+                "content": [{"type": "text", "text": f"Error calling tool '{name}': {e}"}],
+                "isError": True
+            }}
+        return {"jsonrpc": "2.0", "result": {"content": [{"type": "text", "text": text}]}}
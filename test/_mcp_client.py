@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Shared MCP stdio client for the test scripts - one long-lived server per session."""
+
+import json
+import re
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+# Default bound on any single request, so one stuck call cannot hang the run
+DEFAULT_TIMEOUT = 30
+# Grace period for each shutdown step: EOF, then terminate, then kill
+SHUTDOWN_GRACE = 5
+# Lines of server stderr kept by default, so a failed start says why
+STDERR_LINES = 64
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+def encode_frame(message: Any) -> bytes:
+    """Serialize one newline-delimited JSON-RPC frame for the server's binary stdin."""
+    return dumps(message) + b"\n"
+
+# The tools/call envelope is fixed; only the id, tool name and arguments are encoded per call
+_CALL_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/call","params":{"name":%s,"arguments":%s}}'
+
+def encode_call(request_id: int, name: str, args: Dict[str, Any]) -> bytes:
+    """Encode one tools/call request (without the trailing newline) from the envelope template."""
+    return _CALL_TEMPLATE % (request_id, dumps(name), dumps(args))
+
+def loads(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# The handshake frames never change, so they are encoded once at import
+INIT_FRAME = encode_frame({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1.0"}
+    }
+})
+NOTIFY_FRAME = encode_frame({
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized"
+})
+
+# Tool payloads that are JSON start with an object or array
+_JSON_START = re.compile(r"\s*[\[{]")
+
+def parse_payload(text: Optional[str]) -> Any:
+    """Parse a tool's text payload as JSON, or return None when it is not JSON.
+
+    Plain-text payloads are rejected by their first character without a parse attempt.
+    """
+    if not text or not _JSON_START.match(text):
+        return None
+    try:
+        return loads(text)
+    except ValueError:
+        return None
+
+def response_text(response: Dict) -> Optional[str]:
+    """Extract the first text content block from a tools/call response."""
+    if "error" in response:
+        return None
+    content = response.get("result", {}).get("content", [])
+    if content:
+        return content[0].get("text", "")
+    return None
+
+class McpClient:
+    """Runs one MCP server over stdio and multiplexes requests to it by id.
+
+    The server is started and initialized once, either by start() or by the
+    first request; requests may then be issued from several threads. A single
+    reader thread routes each response to the Future registered for its id.
+    """
+
+    def __init__(self, cmd: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT, stderr_lines: int = STDERR_LINES):
+        self.cmd = cmd
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.proc = None
+        # The last stderr_lines lines of server stderr are kept and quoted in
+        # errors; with stderr_lines=0 stderr is discarded
+        self.stderr_tail = deque(maxlen=stderr_lines) if stderr_lines else None
+        # Serializes lazy starts; a failed start is remembered so that queued
+        # requests fail fast instead of each retrying the handshake
+        self._start_lock = threading.Lock()
+        self._start_error: Optional[str] = None
+        # serverInfo/capabilities advertised in the initialize response
+        self.server_caps: Dict[str, Any] = {}
+        self._next_id = 1
+        # Guards id allocation, stdin writes and the pending-response table
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self._closed = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Start the server and complete the MCP handshake."""
+        if self.proc is not None:
+            return
+        # stderr is either discarded or drained by a thread: an unread pipe
+        # would eventually fill and stall a server that lives for the session
+        proc = self.proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL if self.stderr_tail is None else subprocess.PIPE,
+            bufsize=65536,
+            cwd=self.cwd,
+            env=self.env
+        )
+        self._closed = False
+        threading.Thread(target=self._read_loop, args=(proc,), daemon=True).start()
+        if self.stderr_tail is not None:
+            threading.Thread(target=self._drain_stderr, args=(proc,), daemon=True).start()
+
+        # The initialized notification needs no reply, so it goes out in the
+        # same write as initialize; the server reads the two in order
+        try:
+            init_response = self._request(1, INIT_FRAME + NOTIFY_FRAME, self.timeout)
+        except (FutureTimeoutError, OSError):
+            init_response = None
+        if init_response is None:
+            self.close()
+            raise RuntimeError("MCP server did not answer initialize" + self._stderr_note())
+        result = (init_response or {}).get("result", {})
+        self.server_caps = {
+            "serverInfo": result.get("serverInfo", {}),
+            "capabilities": result.get("capabilities", {})
+        }
+
+    def _ensure_started(self):
+        """Start the server on first use, from whichever thread gets here first."""
+        with self._start_lock:
+            if self.proc is not None:
+                return
+            if self._start_error:
+                raise RuntimeError(self._start_error)
+            try:
+                self.start()
+            except Exception as e:
+                self._start_error = str(e)
+                raise
+
+    def close(self):
+        """Send EOF to the server, escalating to terminate and then kill if it lingers."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=SHUTDOWN_GRACE)
+        except subprocess.TimeoutExpired:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=SHUTDOWN_GRACE)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self.proc = None
+
+    def _write(self, frame: bytes):
+        self.proc.stdin.write(frame)
+        self.proc.stdin.flush()
+
+    def _drain_stderr(self, proc: subprocess.Popen):
+        """Keep proc's stderr pipe empty, retaining only the bounded tail."""
+        for line in proc.stderr:
+            self.stderr_tail.append(line.decode("utf-8", "replace").rstrip("\n"))
+
+    def _stderr_note(self) -> str:
+        if not self.stderr_tail:
+            return ""
+        return f". Stderr tail: {' | '.join(list(self.stderr_tail)[-5:])}"
+
+    def _read_loop(self, proc: subprocess.Popen):
+        """Route each response on proc's stdout to the request waiting on its id.
+
+        The thread reads only the process it was started for, so it neither
+        trips over close() clearing self.proc nor competes with the reader of
+        a server started later.
+        """
+        while True:
+            line = proc.stdout.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                response = loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(response, dict):
+                continue
+            with self._lock:
+                future = self._pending.pop(response.get("id"), None)
+            if future:
+                future.set_result(response)
+        # Server exited: release every request still waiting, unless a newer
+        # server has already taken its place
+        with self._lock:
+            if self.proc is not None and self.proc is not proc:
+                return
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_result(None)
+
+    def _request(self, request_id: int, frame: bytes, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Write one frame and block until its response is routed back."""
+        future = Future()
+        try:
+            with self._lock:
+                if self._closed:
+                    return None
+                self._pending[request_id] = future
+                # Inside the try, so a failed write (the server died) still
+                # unregisters the future
+                self._write(frame)
+            return future.result(timeout=timeout)
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def _no_response(self) -> Dict:
+        return {"error": {"code": -1, "message": f"No response found. Server exited with code {self.proc.poll() if self.proc else None}{self._stderr_note()}"}}
+
+    def _roundtrip(self, build_frame: Callable[[int], bytes], timeout: Optional[float]) -> Dict:
+        """Allocate an id, send the frame built for it and return the response, or an error dict.
+
+        Waits at most timeout seconds (the client default when None).
+        """
+        if timeout is None:
+            timeout = self.timeout
+        try:
+            self._ensure_started()
+            with self._lock:
+                self._next_id += 1
+                request_id = self._next_id
+            response = self._request(request_id, build_frame(request_id), timeout)
+        except FutureTimeoutError:
+            return {"error": {"code": -2, "message": "Request timeout"}}
+        except Exception as e:
+            return {"error": {"code": -3, "message": str(e)}}
+
+        if response is None:
+            return self._no_response()
+        return response
+
+    def request(self, method: str, params: Dict[str, Any] = None, timeout: Optional[float] = None) -> Dict:
+        """Send one JSON-RPC request and return its response, or an error dict."""
+        return self._roundtrip(lambda request_id: encode_frame({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params or {}
+        }), timeout)
+
+    def call(self, name: str, args: Dict[str, Any], timeout: Optional[float] = None) -> Dict:
+        """Invoke one tool and return the raw JSON-RPC response."""
+        return self._roundtrip(lambda request_id: encode_call(request_id, name, args) + b"\n", timeout)
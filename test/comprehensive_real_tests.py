@@ -4,14 +4,13 @@
 import sys
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
+from _fixtures import require_jira_settings
+
 def run_test_suite(test_file: str, description: str, use_docker: bool = True) -> Dict[str, Any]:
-    """Run a test suite and return results."""
-    print(f"\n{'='*60}")
-    print(f"🧪 {description}")
-    print(f"{'='*60}")
-    
+    """Run a test suite and return results; output is printed later by print_suite_report."""
     cmd = ["python", test_file]
     if not use_docker:
         cmd.append("--local")
@@ -25,10 +24,6 @@ def run_test_suite(test_file: str, description: str, use_docker: bool = True) ->
             timeout=120
         )
         
-        print(result.stdout)
-        if result.stderr:
-            print(f"STDERR: {result.stderr}")
-        
         return {
             "name": description,
             "exit_code": result.returncode,
@@ -38,22 +33,35 @@ def run_test_suite(test_file: str, description: str, use_docker: bool = True) ->
         }
         
     except subprocess.TimeoutExpired:
-        print(f"❌ TIMEOUT: {description} took too long")
         return {
             "name": description,
             "exit_code": -1,
             "success": False,
-            "error": "Timeout"
+            "error": "Timeout",
+            "report": f"❌ TIMEOUT: {description} took too long"
         }
     except Exception as e:
-        print(f"❌ ERROR: {description} failed: {e}")
         return {
             "name": description,
             "exit_code": -2,
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            "report": f"❌ ERROR: {description} failed: {e}"
         }
 
+def print_suite_report(result: Dict[str, Any]):
+    """Print one suite's captured output under its header."""
+    print(f"\n{'='*60}")
+    print(f"🧪 {result['name']}")
+    print(f"{'='*60}")
+    
+    if "report" in result:
+        print(result["report"])
+        return
+    print(result["stdout"])
+    if result["stderr"]:
+        print(f"STDERR: {result['stderr']}")
+
 def extract_metrics(results: Dict[str, Any]) -> Dict[str, Any]:
     """Extract key metrics from test results."""
     metrics = {}
@@ -189,10 +197,16 @@ def print_comprehensive_summary(all_results: List[Dict[str, Any]]):
 def main():
     """Main comprehensive test runner."""
     use_docker = "--local" not in sys.argv
+    # Suites are independent, so they run at the same time unless --serial
+    # is passed (e.g. to keep their Jira writes from interleaving)
+    max_workers = 1 if "--serial" in sys.argv else None
     
     print("🚀 COMPREHENSIVE REAL CONTENT TEST SUITE")
     print(f"Running tests {'with Docker' if use_docker else 'locally'}")
     
+    # Every suite would start a server that exits on missing settings
+    require_jira_settings(use_docker)
+    
     # Define test suites to run
     test_suites = [
         ("test/real_content_tests.py", "Real Content Analysis"),
@@ -203,10 +217,14 @@ def main():
     all_results = []
     
     try:
-        # Run each test suite
-        for test_file, description in test_suites:
-            result = run_test_suite(test_file, description, use_docker)
-            all_results.append(result)
+        # Run the suites concurrently; reports are printed in suite order as
+        # each one becomes available
+        with ThreadPoolExecutor(max_workers=max_workers or len(test_suites)) as executor:
+            for result in executor.map(
+                lambda suite: run_test_suite(suite[0], suite[1], use_docker), test_suites
+            ):
+                print_suite_report(result)
+                all_results.append(result)
         
         # Print comprehensive summary
         print_comprehensive_summary(all_results)
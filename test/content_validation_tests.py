@@ -1,80 +1,46 @@
 #!/usr/bin/env python3
 """Content validation test suite for JIRA MCP Server - Tests actual data content and structure."""
 
-import json
-import subprocess
 import sys
-import os
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List
+
+from _fixtures import ENV_PATH, ISSUE_KEY, PROJECT, PROJECT_JQL, PROJECT_ROOT, require_jira_settings
+from _mcp_client import McpClient, parse_payload, response_text
+
+# Several validators inspect the same payload, so each text is parsed once
+_payload = lru_cache(maxsize=32)(parse_payload)
+# Keyword checks may test one payload several times; lowercase it only once
+_lower = lru_cache(maxsize=32)(str.lower)
 
 class ContentValidationTester:
     def __init__(self, use_docker=True):
         self.use_docker = use_docker
         self.test_results = []
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        env_path = os.path.join(project_root, ".env")
         self.docker_cmd = [
-            "docker", "run", "-i", "--rm", "--env-file", env_path,
+            "docker", "run", "-i", "--rm", "--env-file", ENV_PATH,
             "royashish/jira-mcp-server:latest"
         ] if use_docker else ["python", "server.py"]
+        # Docker commands run from the project root; passed to Popen as cwd
+        self._run_cwd = PROJECT_ROOT if use_docker else None
+        # One server is started on the first request and shared by every test
+        self._client = McpClient(self.docker_cmd, cwd=self._run_cwd)
         
     def send_mcp_request(self, method: str, params: Dict[str, Any] = None) -> Dict:
-        """Send MCP request and return response."""
-        messages = [
-            json.dumps({
-                "jsonrpc": "2.0", "id": 1, "method": "initialize",
-                "params": {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
-            }),
-            json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}),
-            json.dumps({"jsonrpc": "2.0", "id": 2, "method": method, "params": params or {}})
-        ]
-        
-        input_data = "\n".join(messages) + "\n"
-        
-        try:
-            original_cwd = os.getcwd()
-            if self.use_docker:
-                os.chdir(os.path.dirname(os.getcwd()))
-            
-            process = subprocess.Popen(
-                self.docker_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE, text=True
-            )
-            
-            stdout, stderr = process.communicate(input=input_data, timeout=30)
-            os.chdir(original_cwd)
-            
-            if stdout:
-                lines = stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        try:
-                            response = json.loads(line)
-                            if response.get("id") == 2:
-                                return response
-                        except json.JSONDecodeError:
-                            continue
-            
-            return {"error": {"code": -1, "message": f"No response. stderr: {stderr}"}}
-            
-        except Exception as e:
-            return {"error": {"code": -3, "message": str(e)}}
+        """Send MCP request over the shared server and return its response."""
+        return self._client.request(method, params)
+
+    def close(self):
+        """Send EOF to the server and wait for it to exit."""
+        self._client.close()
 
-    def get_response_text(self, response: Dict) -> Optional[str]:
-        """Extract text content from MCP response."""
-        if "error" in response:
-            return None
-        result = response.get("result", {})
-        content = result.get("content", [])
-        if content and len(content) > 0:
-            return content[0].get("text", "")
-        return None
+    get_response_text = staticmethod(response_text)
 
     def validate_json_structure(self, text: str, expected_keys: List[str]) -> bool:
         """Validate JSON response contains expected keys."""
         try:
-            data = json.loads(text)
+            data = _payload(text)
             if isinstance(data, list) and len(data) > 0:
                 data = data[0]  # Check first item in array
             return all(key in data for key in expected_keys)
@@ -89,7 +55,7 @@ class ContentValidationTester:
     def validate_project_structure(self, text: str) -> bool:
         """Validate project data structure."""
         try:
-            data = json.loads(text)
+            data = _payload(text)
             if isinstance(data, list):
                 for project in data:
                     if not all(key in project for key in ['key', 'name']):
@@ -134,95 +100,44 @@ class ContentValidationTester:
         print("🔍 Starting Content Validation Test Suite")
         print("=" * 60)
         
-        # Test 1: User Stories - Validate issue structure
-        print("\n📋 Testing User Stories Content")
-        self.test_content_validation(
-            "get_user_stories", 
-            {"project": "KW", "limit": 3},
-            lambda text: self.validate_json_structure(text, ['key', 'summary']) and self.validate_issue_key_format(text),
-            "User stories should have key and summary fields with valid issue keys"
-        )
-        
-        # Test 2: Projects - Validate project structure
-        print("\n🏗️ Testing Projects Content")
-        self.test_content_validation(
-            "get_projects",
-            {},
-            self.validate_project_structure,
-            "Projects should have key and name fields"
-        )
-        
-        # Test 3: Issue Details - Validate comprehensive issue data
-        print("\n🎫 Testing Issue Details Content")
-        self.test_content_validation(
-            "get_issue",
-            {"key": "KW-40"},
-            lambda text: self.validate_json_structure(text, ['key', 'fields', 'summary']) and 'KW-40' in text,
-            "Issue should contain key, fields, summary and match requested issue key"
-        )
-        
-        # Test 4: Search Results - Validate search functionality
-        print("\n🔍 Testing Search Results Content")
-        self.test_content_validation(
-            "search_issues",
-            {"jql": "project = KW", "limit": 5},
-            lambda text: self.validate_json_structure(text, ['issues']) or self.validate_issue_key_format(text),
-            "Search should return issues array or contain valid issue keys"
-        )
-        
-        # Test 5: Project Stats - Validate statistical data
-        print("\n📊 Testing Project Statistics Content")
-        self.test_content_validation(
-            "get_project_stats",
-            {"project": "KW"},
-            lambda text: any(keyword in text.lower() for keyword in ['total', 'count', 'issues', 'status']),
-            "Project stats should contain statistical information"
-        )
-        
-        # Test 6: Issue Types - Validate issue type structure
-        print("\n🏷️ Testing Issue Types Content")
-        self.test_content_validation(
-            "get_issue_types",
-            {"project": "KW"},
-            lambda text: self.validate_json_structure(text, ['name']) or 'story' in text.lower() or 'task' in text.lower(),
-            "Issue types should contain name field or common issue type names"
-        )
-        
-        # Test 7: Transitions - Validate workflow transitions
-        print("\n🔄 Testing Transitions Content")
-        self.test_content_validation(
-            "get_transitions",
-            {"key": "KW-40"},
-            lambda text: any(status in text.lower() for status in ['progress', 'done', 'todo', 'review']),
-            "Transitions should contain workflow status names"
-        )
-        
-        # Test 8: Comments - Validate comment addition
-        print("\n💬 Testing Comment Addition")
-        self.test_content_validation(
-            "add_comment",
-            {"key": "KW-40", "comment": "Content validation test comment"},
-            lambda text: 'comment' in text.lower() and ('added' in text.lower() or 'created' in text.lower()),
-            "Comment addition should confirm comment was added"
-        )
-        
-        # Test 9: Boards - Validate agile board data
-        print("\n🏃 Testing Agile Boards Content")
-        self.test_content_validation(
-            "get_boards",
-            {},
-            lambda text: self.validate_json_structure(text, ['name']) or 'board' in text.lower(),
-            "Boards should contain name field or board-related content"
-        )
+        tests = [
+            ("📋 Testing User Stories Content", "get_user_stories", {"project": PROJECT, "limit": 3},
+             lambda text: self.validate_json_structure(text, ['key', 'summary']) and self.validate_issue_key_format(text),
+             "User stories should have key and summary fields with valid issue keys"),
+            ("🏗️ Testing Projects Content", "get_projects", {},
+             self.validate_project_structure,
+             "Projects should have key and name fields"),
+            ("🎫 Testing Issue Details Content", "get_issue", {"key": ISSUE_KEY},
+             lambda text: self.validate_json_structure(text, ['key', 'fields', 'summary']) and ISSUE_KEY in text,
+             "Issue should contain key, fields, summary and match requested issue key"),
+            ("🔍 Testing Search Results Content", "search_issues", {"jql": PROJECT_JQL, "limit": 5},
+             lambda text: self.validate_json_structure(text, ['issues']) or self.validate_issue_key_format(text),
+             "Search should return issues array or contain valid issue keys"),
+            ("📊 Testing Project Statistics Content", "get_project_stats", {"project": PROJECT},
+             lambda text: any(keyword in _lower(text) for keyword in ['total', 'count', 'issues', 'status']),
+             "Project stats should contain statistical information"),
+            ("🏷️ Testing Issue Types Content", "get_issue_types", {"project": PROJECT},
+             lambda text: self.validate_json_structure(text, ['name']) or 'story' in _lower(text) or 'task' in _lower(text),
+             "Issue types should contain name field or common issue type names"),
+            ("🔄 Testing Transitions Content", "get_transitions", {"key": ISSUE_KEY},
+             lambda text: any(status in _lower(text) for status in ['progress', 'done', 'todo', 'review']),
+             "Transitions should contain workflow status names"),
+            ("💬 Testing Comment Addition", "add_comment", {"key": ISSUE_KEY, "comment": "Content validation test comment"},
+             lambda text: 'comment' in _lower(text) and ('added' in _lower(text) or 'created' in _lower(text)),
+             "Comment addition should confirm comment was added"),
+            ("🏃 Testing Agile Boards Content", "get_boards", {},
+             lambda text: self.validate_json_structure(text, ['name']) or 'board' in _lower(text),
+             "Boards should contain name field or board-related content"),
+            ("🔧 Testing Custom Fields Content", "get_custom_fields", {},
+             lambda text: 'field' in _lower(text) and ('custom' in _lower(text) or 'name' in _lower(text)),
+             "Custom fields should contain field definitions with names"),
+        ]
         
-        # Test 10: Custom Fields - Validate field definitions
-        print("\n🔧 Testing Custom Fields Content")
-        self.test_content_validation(
-            "get_custom_fields",
-            {},
-            lambda text: 'field' in text.lower() and ('custom' in text.lower() or 'name' in text.lower()),
-            "Custom fields should contain field definitions with names"
-        )
+        # The server handles one tool call at a time, so the calls go out
+        # serially rather than queueing against each other's timeouts
+        for header, tool_name, arguments, validation_func, description in tests:
+            print(f"\n{header}")
+            self.test_content_validation(tool_name, arguments, validation_func, description)
 
     def run_data_integrity_tests(self):
         """Run tests that verify data integrity and relationships."""
@@ -232,17 +147,17 @@ class ContentValidationTester:
         # Test issue existence before operations
         print("\n🎫 Verifying Issue Exists Before Operations")
         response = self.send_mcp_request("tools/call", {
-            "name": "get_issue", "arguments": {"key": "KW-40"}
+            "name": "get_issue", "arguments": {"key": ISSUE_KEY}
         })
         
         text = self.get_response_text(response)
-        if text and "KW-40" in text and "Error:" not in text:
-            print("  ✅ Issue KW-40 exists and accessible")
+        if text and ISSUE_KEY in text and "Error:" not in text:
+            print(f"  ✅ Issue {ISSUE_KEY} exists and accessible")
             
             # Test that issue operations reference the same issue
             print("\n🔄 Testing Issue Operation Consistency")
             transitions_response = self.send_mcp_request("tools/call", {
-                "name": "get_transitions", "arguments": {"key": "KW-40"}
+                "name": "get_transitions", "arguments": {"key": ISSUE_KEY}
             })
             
             transitions_text = self.get_response_text(transitions_response)
@@ -253,7 +168,7 @@ class ContentValidationTester:
                 print("  ❌ Transitions failed for existing issue")
                 self.test_results.append({"tool": "data_integrity", "status": "INVALID", "test": "issue_consistency"})
         else:
-            print("  ⚠️  Issue KW-40 not accessible - skipping integrity tests")
+            print(f"  ⚠️  Issue {ISSUE_KEY} not accessible - skipping integrity tests")
             self.test_results.append({"tool": "data_integrity", "status": "SKIPPED", "test": "issue_not_found"})
 
     def run_response_format_tests(self):
@@ -263,30 +178,25 @@ class ContentValidationTester:
         
         tools_to_test = [
             ("get_projects", {}),
-            ("get_user_stories", {"project": "KW", "limit": 2}),
-            ("search_issues", {"jql": "project = KW", "limit": 2})
+            ("get_user_stories", {"project": PROJECT, "limit": 2}),
+            ("search_issues", {"jql": PROJECT_JQL, "limit": 2})
         ]
         
         for tool_name, args in tools_to_test:
-            response = self.send_mcp_request("tools/call", {
-                "name": tool_name, "arguments": args
-            })
-            
+            response = self.send_mcp_request("tools/call", {"name": tool_name, "arguments": args})
             text = self.get_response_text(response)
             if text:
                 # Check if response is valid JSON
-                try:
-                    json.loads(text)
+                if _payload(text) is not None:
                     print(f"  ✅ {tool_name}: Valid JSON format")
                     self.test_results.append({"tool": f"{tool_name}_format", "status": "VALID", "format": "JSON"})
-                except json.JSONDecodeError:
-                    # Check if it's structured text
-                    if any(indicator in text for indicator in [':', '-', '|', '\n']):
-                        print(f"  ✅ {tool_name}: Structured text format")
-                        self.test_results.append({"tool": f"{tool_name}_format", "status": "VALID", "format": "TEXT"})
-                    else:
-                        print(f"  ❌ {tool_name}: Unstructured response")
-                        self.test_results.append({"tool": f"{tool_name}_format", "status": "INVALID", "format": "UNKNOWN"})
+                # Check if it's structured text
+                elif any(indicator in text for indicator in [':', '-', '|', '\n']):
+                    print(f"  ✅ {tool_name}: Structured text format")
+                    self.test_results.append({"tool": f"{tool_name}_format", "status": "VALID", "format": "TEXT"})
+                else:
+                    print(f"  ❌ {tool_name}: Unstructured response")
+                    self.test_results.append({"tool": f"{tool_name}_format", "status": "INVALID", "format": "UNKNOWN"})
 
     def print_detailed_summary(self):
         """Print detailed test results summary."""
@@ -337,6 +247,8 @@ def main():
     
     print(f"🚀 Running content validation tests {'with Docker' if use_docker else 'locally'}")
     
+    require_jira_settings(use_docker)
+    
     tester = ContentValidationTester(use_docker=use_docker)
     
     try:
@@ -358,6 +270,8 @@ def main():
     except Exception as e:
         print(f"\n💥 Content validation crashed: {e}")
         sys.exit(1)
+    finally:
+        tester.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,156 +6,204 @@ import subprocess
 import sys
 import os
 import re
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from _fixtures import ENV_PATH, PROJECT, require_jira_settings
+from _mcp_client import McpClient, loads, response_text
+
+# Connectivity outcomes that make every later test pointless
+FATAL_CONNECTIVITY_STATUSES = {"AUTH_ERROR", "CONN_ERROR", "INVALID_JSON"}
+
+# Project keys probed by test_project_access
+PROBE_PROJECTS = [PROJECT, "TEST", "DEMO", "PROJ"]
+
+# Invalid get_user_stories inputs exercised by test_error_handling
+ERROR_CASES = [
+    ("Invalid project", {"project": "INVALID", "limit": 1}),
+    ("Zero limit", {"project": PROJECT, "limit": 0}),
+    ("Negative limit", {"project": PROJECT, "limit": -1}),
+    ("Very large limit", {"project": PROJECT, "limit": 10000}),
+]
+
+@dataclass(slots=True)
+class TestResult:
+    """Outcome of one integration test; unused fields keep their defaults."""
+    test: str
+    display_name: str
+    status: str
+    reason: str = ""
+    sample_key: Optional[str] = None
+    sample_summary: str = ""
+    accessible_projects: List[Dict[str, Any]] = field(default_factory=list)
+    total_tested: int = 0
+    valid_keys: List[str] = field(default_factory=list)
+    total_keys: int = 0
+    total_stories: int = 0
+    test_indicators: int = 0
+    recent_indicators: int = 0
+    freshness_score: float = 0.0
+    tests_passed: int = 0
+    total_tests: int = 0
+    handling_rate: float = 0.0
 
 class JiraIntegrationTester:
     def __init__(self, use_docker=True):
         self.use_docker = use_docker
-        self.test_results = []
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        env_path = os.path.join(project_root, ".env")
+        self.test_results: Dict[str, TestResult] = {}
         self.docker_cmd = [
-            "docker", "run", "-i", "--rm", "--env-file", env_path,
+            "docker", "run", "-i", "--rm", "--env-file", ENV_PATH,
             "royashish/jira-mcp-server:latest"
         ] if use_docker else ["python", "server.py"]
-        
+        self._container = None
+        # Docker commands run from the directory above the test runner's cwd
+        self._run_cwd = os.path.dirname(os.getcwd()) if use_docker else None
+        # One server is started on the first request and shared by every
+        # test; the client is created by setup(), once the command is final
+        self._client: Optional[McpClient] = None
+        # Classified get_user_stories results keyed by (project, limit)
+        self._stories: Dict[Tuple[str, int], Tuple[Optional[Any], Optional[str], Optional[str]]] = {}
+        
+    def setup(self):
+        """Start one idle container; the MCP session then runs in it via docker exec."""
+        if self._client is not None:
+            return
+        if self.use_docker:
+            container = f"jira-mcp-test-{os.getpid()}"
+            result = subprocess.run(
+                ["docker", "run", "-d", "--rm", "--env-file", ENV_PATH, "--name", container,
+                 "royashish/jira-mcp-server:latest", "tail", "-f", "/dev/null"],
+                capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                # Fall back to docker run for the session
+                print(f"⚠️  Could not pre-start container, using docker run: {result.stderr.strip()}")
+            else:
+                self._container = container
+                self.docker_cmd = ["docker", "exec", "-i", container, "python", "server.py"]
+        self._client = McpClient(self.docker_cmd, cwd=self._run_cwd)
+
+    def teardown(self):
+        """Stop the server and remove the shared container."""
+        self.close()
+        if self._container:
+            subprocess.run(["docker", "rm", "-f", self._container], capture_output=True)
+            self._container = None
+
     def send_mcp_request(self, method: str, params: Dict[str, Any] = None) -> Dict:
-        """Send MCP request and return response."""
-        messages = [
-            json.dumps({
-                "jsonrpc": "2.0", "id": 1, "method": "initialize",
-                "params": {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0"}}
-            }),
-            json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}),
-            json.dumps({"jsonrpc": "2.0", "id": 2, "method": method, "params": params or {}})
-        ]
-        
-        input_data = "\n".join(messages) + "\n"
+        """Send MCP request over the shared server and return its response."""
+        return self._client.request(method, params)
+
+    def close(self):
+        """Send EOF to the server and wait for it to exit."""
+        if self._client is not None:
+            self._client.close()
+
+    get_response_text = staticmethod(response_text)
+
+    def _call_get_user_stories(self, project: str, limit: int) -> Tuple[Optional[Any], Optional[str], Optional[str]]:
+        """Return the classified get_user_stories result, fetching it on first use."""
+        if (project, limit) not in self._stories:
+            self._stories[(project, limit)] = self._fetch_user_stories(project, limit)
+        return self._stories[(project, limit)]
+
+    def _fetch_user_stories(self, project: str, limit: int) -> Tuple[Optional[Any], Optional[str], Optional[str]]:
+        """Call get_user_stories and classify the result.
+
+        Returns ``(data, error_tag, text)`` where ``data`` is the parsed JSON
+        payload (or None) and ``error_tag`` is one of ``"no_text"``,
+        ``"placeholder"``, ``"error"``, ``"invalid_json"`` or None on success.
+        """
+        response = self.send_mcp_request("tools/call", {
+            "name": "get_user_stories", "arguments": {"project": project, "limit": limit}
+        })
         
+        text = self.get_response_text(response)
+        if not text:
+            return None, "no_text", text
+        if "Tool implementation placeholder" in text:
+            return None, "placeholder", text
+        if "Error:" in text:
+            return None, "error", text
         try:
-            original_cwd = os.getcwd()
-            if self.use_docker:
-                os.chdir(os.path.dirname(os.getcwd()))
-            
-            process = subprocess.Popen(
-                self.docker_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE, text=True
-            )
-            
-            stdout, stderr = process.communicate(input=input_data, timeout=30)
-            os.chdir(original_cwd)
-            
-            if stdout:
-                lines = stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        try:
-                            response = json.loads(line)
-                            if response.get("id") == 2:
-                                return response
-                        except json.JSONDecodeError:
-                            continue
-            
-            return {"error": {"code": -1, "message": f"No response. stderr: {stderr}"}}
-            
-        except Exception as e:
-            return {"error": {"code": -3, "message": str(e)}}
-
-    def get_response_text(self, response: Dict) -> Optional[str]:
-        """Extract text content from MCP response."""
-        if "error" in response:
-            return None
-        result = response.get("result", {})
-        content = result.get("content", [])
-        if content and len(content) > 0:
-            return content[0].get("text", "")
-        return None
+            return loads(text), None, text
+        except json.JSONDecodeError:
+            return None, "invalid_json", text
 
     def test_jira_connectivity(self):
         """Test basic JIRA connectivity through get_user_stories."""
         print("🔌 Testing JIRA Connectivity")
         
-        response = self.send_mcp_request("tools/call", {
-            "name": "get_user_stories", "arguments": {"project": "KW", "limit": 1}
-        })
-        
-        text = self.get_response_text(response)
-        if not text:
+        data, error_tag, text = self._call_get_user_stories(PROJECT, 1)
+        if error_tag == "no_text":
             print("  ❌ FAILED: No response from server")
-            self.test_results.append({"test": "connectivity", "status": "FAILED", "reason": "No response"})
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="FAILED", reason="No response")
             return False
         
-        if "Tool implementation placeholder" in text:
+        if error_tag == "placeholder":
             print("  ⚠️  SKIPPED: Tool not implemented")
-            self.test_results.append({"test": "connectivity", "status": "SKIPPED", "reason": "Not implemented"})
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="SKIPPED", reason="Not implemented")
             return False
         
-        if "Error:" in text and "authentication" in text.lower():
+        if error_tag == "error" and "authentication" in text.lower():
             print("  ❌ AUTHENTICATION ERROR: Check JIRA credentials")
             print(f"    {text[:200]}...")
-            self.test_results.append({"test": "connectivity", "status": "AUTH_ERROR", "reason": text[:200]})
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="AUTH_ERROR", reason=text[:200])
             return False
         
-        if "Error:" in text and "connection" in text.lower():
+        if error_tag == "error" and "connection" in text.lower():
             print("  ❌ CONNECTION ERROR: Check JIRA URL")
             print(f"    {text[:200]}...")
-            self.test_results.append({"test": "connectivity", "status": "CONN_ERROR", "reason": text[:200]})
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="CONN_ERROR", reason=text[:200])
             return False
         
-        if "Error:" in text:
+        if error_tag == "error":
             print("  ❌ JIRA API ERROR:")
             print(f"    {text[:200]}...")
-            self.test_results.append({"test": "connectivity", "status": "API_ERROR", "reason": text[:200]})
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="API_ERROR", reason=text[:200])
             return False
         
-        try:
-            data = json.loads(text)
-            if "stories" in data and len(data["stories"]) > 0:
-                story = data["stories"][0]
-                print(f"  ✅ CONNECTED: Retrieved story {story.get('key', 'unknown')}")
-                print(f"    Summary: {story.get('summary', 'No summary')[:60]}...")
-                self.test_results.append({
-                    "test": "connectivity", 
-                    "status": "SUCCESS", 
-                    "sample_key": story.get('key'),
-                    "sample_summary": story.get('summary', '')[:100]
-                })
-                return True
-            else:
-                print("  ⚠️  CONNECTED but no stories found")
-                self.test_results.append({"test": "connectivity", "status": "NO_DATA", "reason": "No stories in project"})
-                return True
-        except json.JSONDecodeError:
+        if error_tag == "invalid_json":
             print("  ❌ INVALID RESPONSE: Not valid JSON")
             print(f"    Raw: {text[:200]}...")
-            self.test_results.append({"test": "connectivity", "status": "INVALID_JSON", "reason": text[:200]})
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="INVALID_JSON", reason=text[:200])
             return False
+        
+        if "stories" in data and len(data["stories"]) > 0:
+            story = data["stories"][0]
+            print(f"  ✅ CONNECTED: Retrieved story {story.get('key', 'unknown')}")
+            print(f"    Summary: {story.get('summary', 'No summary')[:60]}...")
+            self.test_results["connectivity"] = TestResult(
+                test="connectivity",
+                display_name="Connectivity",
+                status="SUCCESS", 
+                sample_key=story.get('key'),
+                sample_summary=story.get('summary', '')[:100]
+            )
+        else:
+            print("  ⚠️  CONNECTED but no stories found")
+            self.test_results["connectivity"] = TestResult(test="connectivity", display_name="Connectivity", status="NO_DATA", reason="No stories in project")
+        return True
 
     def test_project_access(self):
         """Test access to different projects."""
         print("\n🏗️ Testing Project Access")
         
         # Test with different project keys
-        test_projects = ["KW", "TEST", "DEMO", "PROJ"]
+        test_projects = PROBE_PROJECTS
         accessible_projects = []
         
         for project in test_projects:
             print(f"  Testing project {project}...")
             
-            response = self.send_mcp_request("tools/call", {
-                "name": "get_user_stories", "arguments": {"project": project, "limit": 1}
-            })
-            
-            text = self.get_response_text(response)
-            if text and "Error:" not in text and "Tool implementation placeholder" not in text:
-                try:
-                    data = json.loads(text)
-                    if "stories" in data:
-                        story_count = len(data["stories"])
-                        print(f"    ✅ {project}: {story_count} stories accessible")
-                        accessible_projects.append({"key": project, "story_count": story_count})
-                except:
-                    pass
+            data, error_tag, text = self._call_get_user_stories(project, 1)
+            if error_tag is None:
+                if "stories" in data:
+                    story_count = len(data["stories"])
+                    print(f"    ✅ {project}: {story_count} stories accessible")
+                    accessible_projects.append({"key": project, "story_count": story_count})
+            elif error_tag == "invalid_json":
+                pass
             elif text and "not found" in text.lower():
                 print(f"    ❌ {project}: Project not found")
             elif text and "permission" in text.lower():
@@ -167,12 +215,13 @@ class JiraIntegrationTester:
         for proj in accessible_projects:
             print(f"    {proj['key']}: {proj['story_count']} stories")
         
-        self.test_results.append({
-            "test": "project_access",
-            "status": "ANALYZED",
-            "accessible_projects": accessible_projects,
-            "total_tested": len(test_projects)
-        })
+        self.test_results["project_access"] = TestResult(
+            test="project_access",
+            display_name="Project Access",
+            status="ANALYZED",
+            accessible_projects=accessible_projects,
+            total_tested=len(test_projects)
+        )
         
         return len(accessible_projects) > 0
 
@@ -181,18 +230,13 @@ class JiraIntegrationTester:
         print("\n🎫 Testing Issue Key Access")
         
         # First get some issue keys from user stories
-        response = self.send_mcp_request("tools/call", {
-            "name": "get_user_stories", "arguments": {"project": "KW", "limit": 5}
-        })
-        
-        text = self.get_response_text(response)
-        if not text or "Error:" in text or "Tool implementation placeholder" in text:
+        data, error_tag, _ = self._call_get_user_stories(PROJECT, 5)
+        if error_tag in ("no_text", "error", "placeholder"):
             print("  ⚠️  Cannot get issue keys - skipping test")
-            self.test_results.append({"test": "issue_access", "status": "SKIPPED", "reason": "No issue keys available"})
+            self.test_results["issue_access"] = TestResult(test="issue_access", display_name="Issue Access", status="SKIPPED", reason="No issue keys available")
             return False
         
         try:
-            data = json.loads(text)
             stories = data.get("stories", [])
             if not stories:
                 print("  ⚠️  No stories found - skipping test")
@@ -213,12 +257,13 @@ class JiraIntegrationTester:
             
             print(f"  📊 Valid Issue Keys: {len(valid_keys)}/{len(test_keys)}")
             
-            self.test_results.append({
-                "test": "issue_access",
-                "status": "ANALYZED",
-                "valid_keys": valid_keys,
-                "total_keys": len(test_keys)
-            })
+            self.test_results["issue_access"] = TestResult(
+                test="issue_access",
+                display_name="Issue Access",
+                status="ANALYZED",
+                valid_keys=valid_keys,
+                total_keys=len(test_keys)
+            )
             
             return len(valid_keys) == len(test_keys)
             
@@ -230,17 +275,12 @@ class JiraIntegrationTester:
         """Test if data is fresh and up-to-date."""
         print("\n🕐 Testing Data Freshness")
         
-        response = self.send_mcp_request("tools/call", {
-            "name": "get_user_stories", "arguments": {"project": "KW", "limit": 10}
-        })
-        
-        text = self.get_response_text(response)
-        if not text or "Error:" in text or "Tool implementation placeholder" in text:
+        data, error_tag, _ = self._call_get_user_stories(PROJECT, 10)
+        if error_tag in ("no_text", "error", "placeholder"):
             print("  ⚠️  Cannot test data freshness")
             return False
         
         try:
-            data = json.loads(text)
             stories = data.get("stories", [])
             
             # Look for recent activity indicators
@@ -272,14 +312,15 @@ class JiraIntegrationTester:
             freshness_score = ((test_indicators + recent_indicators) / (len(stories) * 2)) * 100
             print(f"  📊 Data Freshness Score: {freshness_score:.1f}%")
             
-            self.test_results.append({
-                "test": "data_freshness",
-                "status": "ANALYZED",
-                "total_stories": len(stories),
-                "test_indicators": test_indicators,
-                "recent_indicators": recent_indicators,
-                "freshness_score": freshness_score
-            })
+            self.test_results["data_freshness"] = TestResult(
+                test="data_freshness",
+                display_name="Data Freshness",
+                status="ANALYZED",
+                total_stories=len(stories),
+                test_indicators=test_indicators,
+                recent_indicators=recent_indicators,
+                freshness_score=freshness_score
+            )
             
             return freshness_score > 20  # At least some recent activity
             
@@ -291,120 +332,129 @@ class JiraIntegrationTester:
         """Test how the server handles various error conditions."""
         print("\n⚠️ Testing Error Handling")
         
-        error_tests = [
-            ("Invalid project", {"project": "INVALID", "limit": 1}),
-            ("Zero limit", {"project": "KW", "limit": 0}),
-            ("Negative limit", {"project": "KW", "limit": -1}),
-            ("Very large limit", {"project": "KW", "limit": 10000}),
-        ]
+        error_tests = ERROR_CASES
         
         error_handling_score = 0
         
         for test_name, args in error_tests:
             print(f"  Testing {test_name}...")
             
-            response = self.send_mcp_request("tools/call", {
-                "name": "get_user_stories", "arguments": args
-            })
-            
-            text = self.get_response_text(response)
-            if text:
-                if "Error:" in text:
-                    print(f"    ✅ Proper error handling")
-                    error_handling_score += 1
-                elif "Tool implementation placeholder" in text:
-                    print(f"    ⚠️  Tool not implemented")
-                else:
-                    print(f"    ❌ No error for invalid input")
-            else:
+            _, error_tag, _ = self._call_get_user_stories(args["project"], args["limit"])
+            if error_tag == "error":
+                print(f"    ✅ Proper error handling")
+                error_handling_score += 1
+            elif error_tag == "placeholder":
+                print(f"    ⚠️  Tool not implemented")
+            elif error_tag == "no_text":
                 print(f"    ❌ No response")
+            else:
+                print(f"    ❌ No error for invalid input")
         
         handling_rate = (error_handling_score / len(error_tests)) * 100
         print(f"  📊 Error Handling Rate: {handling_rate:.1f}%")
         
-        self.test_results.append({
-            "test": "error_handling",
-            "status": "ANALYZED",
-            "tests_passed": error_handling_score,
-            "total_tests": len(error_tests),
-            "handling_rate": handling_rate
-        })
+        self.test_results["error_handling"] = TestResult(
+            test="error_handling",
+            display_name="Error Handling",
+            status="ANALYZED",
+            tests_passed=error_handling_score,
+            total_tests=len(error_tests),
+            handling_rate=handling_rate
+        )
         
         return handling_rate >= 50
 
     def print_integration_summary(self):
         """Print comprehensive integration test summary."""
-        print("\n" + "=" * 60)
-        print("🔌 JIRA INTEGRATION TEST SUMMARY")
-        print("=" * 60)
+        chunks = ["\n" + "=" * 60 + "\n", "🔌 JIRA INTEGRATION TEST SUMMARY\n", "=" * 60 + "\n"]
         
-        for result in self.test_results:
-            test_name = result["test"].replace("_", " ").title()
-            status = result["status"]
-            
-            print(f"\n🔍 {test_name}:")
-            
-            if test_name == "Connectivity":
-                if status == "SUCCESS":
-                    print(f"  ✅ JIRA API Connected Successfully")
-                    print(f"  Sample Issue: {result.get('sample_key', 'N/A')}")
-                    print(f"  Sample Summary: {result.get('sample_summary', 'N/A')[:60]}...")
-                elif status == "AUTH_ERROR":
-                    print(f"  ❌ Authentication Failed")
-                    print(f"  Check JIRA_USERNAME and JIRA_API_TOKEN")
-                elif status == "CONN_ERROR":
-                    print(f"  ❌ Connection Failed")
-                    print(f"  Check JIRA_URL")
-                elif status == "API_ERROR":
-                    print(f"  ❌ JIRA API Error")
-                    print(f"  Reason: {result.get('reason', 'Unknown')[:100]}...")
-                else:
-                    print(f"  ❌ Failed: {status}")
-            
-            elif test_name == "Project Access":
-                accessible = result.get("accessible_projects", [])
-                total = result.get("total_tested", 0)
-                print(f"  Projects Tested: {total}")
-                print(f"  Accessible Projects: {len(accessible)}")
-                for proj in accessible:
-                    print(f"    {proj['key']}: {proj['story_count']} stories")
-            
-            elif test_name == "Issue Access":
-                if status == "ANALYZED":
-                    valid = len(result.get("valid_keys", []))
-                    total = result.get("total_keys", 0)
-                    print(f"  Issue Keys Validated: {valid}/{total}")
-                    if result.get("valid_keys"):
-                        print(f"  Valid Keys: {', '.join(result['valid_keys'][:5])}")
-            
-            elif test_name == "Data Freshness":
-                if status == "ANALYZED":
-                    score = result.get("freshness_score", 0)
-                    print(f"  Freshness Score: {score:.1f}%")
-                    print(f"  Test Indicators: {result.get('test_indicators', 0)}")
-                    print(f"  Recent Activity: {result.get('recent_indicators', 0)}")
-            
-            elif test_name == "Error Handling":
-                if status == "ANALYZED":
-                    rate = result.get("handling_rate", 0)
-                    passed = result.get("tests_passed", 0)
-                    total = result.get("total_tests", 0)
-                    print(f"  Error Handling Rate: {rate:.1f}%")
-                    print(f"  Tests Passed: {passed}/{total}")
+        for test, result in self.test_results.items():
+            chunks.append(f"\n🔍 {result.display_name}:\n")
+            formatter = FORMATTERS.get(test)
+            if formatter:
+                chunks.append(formatter(result))
         
         # Overall integration assessment
-        print(f"\n🎯 INTEGRATION ASSESSMENT:")
+        chunks.append("\n🎯 INTEGRATION ASSESSMENT:\n")
         
-        connectivity_result = next((r for r in self.test_results if r["test"] == "connectivity"), None)
+        connectivity_result = self.test_results.get("connectivity")
         if connectivity_result:
-            if connectivity_result["status"] == "SUCCESS":
-                print("  🎉 EXCELLENT: JIRA integration is working!")
-            elif connectivity_result["status"] in ["AUTH_ERROR", "CONN_ERROR"]:
-                print("  ❌ CRITICAL: Fix JIRA credentials/connection")
+            if connectivity_result.status == "SUCCESS":
+                chunks.append("  🎉 EXCELLENT: JIRA integration is working!\n")
+            elif connectivity_result.status in ["AUTH_ERROR", "CONN_ERROR"]:
+                chunks.append("  ❌ CRITICAL: Fix JIRA credentials/connection\n")
             else:
-                print("  ⚠️  WARNING: JIRA integration issues detected")
+                chunks.append("  ⚠️  WARNING: JIRA integration issues detected\n")
         else:
-            print("  ❓ UNKNOWN: Could not determine integration status")
+            chunks.append("  ❓ UNKNOWN: Could not determine integration status\n")
+        
+        # One write keeps the summary in one piece
+        sys.stdout.write("".join(chunks))
+        sys.stdout.flush()
+
+def _fmt_conn(result: TestResult) -> str:
+    """Format the connectivity result."""
+    status = result.status
+    if status == "SUCCESS":
+        return (
+            "  ✅ JIRA API Connected Successfully\n"
+            f"  Sample Issue: {result.sample_key or 'N/A'}\n"
+            f"  Sample Summary: {(result.sample_summary or 'N/A')[:60]}...\n"
+        )
+    if status == "AUTH_ERROR":
+        return "  ❌ Authentication Failed\n  Check JIRA_USERNAME and JIRA_API_TOKEN\n"
+    if status == "CONN_ERROR":
+        return "  ❌ Connection Failed\n  Check JIRA_URL\n"
+    if status == "API_ERROR":
+        return f"  ❌ JIRA API Error\n  Reason: {(result.reason or 'Unknown')[:100]}...\n"
+    return f"  ❌ Failed: {status}\n"
+
+def _fmt_proj(result: TestResult) -> str:
+    """Format the project access result."""
+    accessible = result.accessible_projects
+    lines = [
+        f"  Projects Tested: {result.total_tested}\n",
+        f"  Accessible Projects: {len(accessible)}\n",
+    ]
+    lines.extend(f"    {proj['key']}: {proj['story_count']} stories\n" for proj in accessible)
+    return "".join(lines)
+
+def _fmt_issue(result: TestResult) -> str:
+    """Format the issue access result."""
+    if result.status != "ANALYZED":
+        return ""
+    valid_keys = result.valid_keys
+    text = f"  Issue Keys Validated: {len(valid_keys)}/{result.total_keys}\n"
+    if valid_keys:
+        text += f"  Valid Keys: {', '.join(valid_keys[:5])}\n"
+    return text
+
+def _fmt_fresh(result: TestResult) -> str:
+    """Format the data freshness result."""
+    if result.status != "ANALYZED":
+        return ""
+    return (
+        f"  Freshness Score: {result.freshness_score:.1f}%\n"
+        f"  Test Indicators: {result.test_indicators}\n"
+        f"  Recent Activity: {result.recent_indicators}\n"
+    )
+
+def _fmt_errors(result: TestResult) -> str:
+    """Format the error handling result."""
+    if result.status != "ANALYZED":
+        return ""
+    return (
+        f"  Error Handling Rate: {result.handling_rate:.1f}%\n"
+        f"  Tests Passed: {result.tests_passed}/{result.total_tests}\n"
+    )
+
+FORMATTERS: Dict[str, Callable[[TestResult], str]] = {
+    "connectivity": _fmt_conn,
+    "project_access": _fmt_proj,
+    "issue_access": _fmt_issue,
+    "data_freshness": _fmt_fresh,
+    "error_handling": _fmt_errors,
+}
 
 def main():
     """Main test runner."""
@@ -412,27 +462,40 @@ def main():
     
     print(f"🚀 Running JIRA integration tests {'with Docker' if use_docker else 'locally'}")
     
+    require_jira_settings(use_docker)
+    
     tester = JiraIntegrationTester(use_docker=use_docker)
     
     try:
+        tester.setup()
+        
         # Run integration tests
         success_count = 0
-        
+
         if tester.test_jira_connectivity():
             success_count += 1
-        
-        if tester.test_project_access():
-            success_count += 1
-        
-        if tester.test_issue_key_validation():
-            success_count += 1
-        
-        if tester.test_data_freshness():
-            success_count += 1
-        
-        if tester.test_error_handling():
-            success_count += 1
-        
+
+        # Every remaining test goes through the same broken connection, so
+        # skip them instead of starting another container per test
+        connectivity_status = tester.test_results["connectivity"].status
+        if connectivity_status in FATAL_CONNECTIVITY_STATUSES:
+            print(f"\n⏭️  Skipping remaining tests: connectivity {connectivity_status}")
+            for test, display_name in (("project_access", "Project Access"), ("issue_access", "Issue Access"),
+                                       ("data_freshness", "Data Freshness"), ("error_handling", "Error Handling")):
+                tester.test_results[test] = TestResult(test=test, display_name=display_name, status="SKIPPED", reason=f"Connectivity {connectivity_status}")
+        else:
+            if tester.test_project_access():
+                success_count += 1
+
+            if tester.test_issue_key_validation():
+                success_count += 1
+
+            if tester.test_data_freshness():
+                success_count += 1
+
+            if tester.test_error_handling():
+                success_count += 1
+
         tester.print_integration_summary()
         
         # Exit based on success rate
@@ -448,6 +511,8 @@ def main():
     except Exception as e:
         print(f"\n💥 JIRA integration tests crashed: {e}")
         sys.exit(1)
+    finally:
+        tester.teardown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file